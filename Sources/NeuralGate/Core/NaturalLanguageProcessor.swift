@@ -9,6 +9,15 @@ public class NaturalLanguageProcessor {
     
     // MARK: - Properties
     
+    /// Common action verbs for task automation
+    private static let actionVerbs: Set<String> = [
+        "send", "create", "schedule", "remind", "call", "message",
+        "email", "set", "open", "start", "stop", "play", "pause"
+    ]
+    
+    /// Keywords that raise a request's priority
+    private static let urgentKeywords = ["urgent", "asap", "immediately", "now", "critical"]
+    
     #if canImport(NaturalLanguage)
     private let tagger: NLTagger
     #endif
@@ -91,15 +100,10 @@ public class NaturalLanguageProcessor {
     }
     
     private func extractAction(from tokens: [String], text: String) -> String {
-        // Common action verbs for task automation
-        let actionVerbs = [
-            "send", "create", "schedule", "remind", "call", "message",
-            "email", "set", "open", "start", "stop", "play", "pause"
-        ]
-        
         for token in tokens {
-            if actionVerbs.contains(token.lowercased()) {
-                return token.lowercased()
+            let lowercasedToken = token.lowercased()
+            if Self.actionVerbs.contains(lowercasedToken) {
+                return lowercasedToken
             }
         }
         
@@ -127,10 +131,9 @@ public class NaturalLanguageProcessor {
     }
     
     private func determinePriority(from text: String) -> Task.Priority {
-        let urgentKeywords = ["urgent", "asap", "immediately", "now", "critical"]
         let textLower = text.lowercased()
         
-        for keyword in urgentKeywords {
+        for keyword in Self.urgentKeywords {
             if textLower.contains(keyword) {
                 return .high
             }
@@ -0,0 +1,83 @@
+import Foundation
+
+/// Fixed-capacity FIFO buffer that overwrites its oldest element once full
+///
+/// Appending and dropping elements from the front are O(1), unlike
+/// `Array.removeFirst(_:)`, which shifts every remaining element. Used for
+/// bounded histories such as telemetry events and learning caches.
+///
+/// Elements are stored unwrapped, so a `RingBuffer<Double>` costs 8 bytes per
+/// slot rather than the 16 an optional would. The trade-off is that
+/// `removeFirst(_:)` does not release the removed elements: their slots keep
+/// them until a later `append` overwrites them, or until the buffer empties.
+/// At most `capacity` elements are ever retained, as when the buffer is full.
+public struct RingBuffer<Element> {
+    /// Maximum number of elements retained
+    public let capacity: Int
+
+    /// Number of elements currently stored
+    public private(set) var count = 0
+
+    // Grows lazily up to `capacity`; logical element `i` lives at `(head + i) % storage.count`
+    private var storage: [Element] = []
+    private var head = 0
+
+    public init(capacity: Int) {
+        precondition(capacity > 0, "RingBuffer capacity must be positive")
+        self.capacity = capacity
+    }
+
+    /// Append an element, evicting the oldest one if the buffer is full
+    public mutating func append(_ element: Element) {
+        if count < storage.count {
+            // A slot freed by removeFirst is available; overwrite its stale element
+            storage[(head + count) % storage.count] = element
+            count += 1
+        } else if storage.count < capacity {
+            if head != 0 {
+                // Re-linearize so the new element can go at the physical end
+                storage = Array(self)
+                head = 0
+            }
+            storage.append(element)
+            count += 1
+        } else {
+            // Full: overwrite the oldest element
+            storage[head] = element
+            head = (head + 1) % storage.count
+        }
+    }
+
+    /// Remove the given number of elements from the front
+    public mutating func removeFirst(_ k: Int) {
+        precondition(k >= 0 && k <= count, "Cannot remove more elements than the buffer holds")
+
+        guard k > 0 else { return }
+
+        if k == count {
+            // Nothing left to keep, so release the storage now
+            removeAll()
+            return
+        }
+
+        head = (head + k) % storage.count
+        count -= k
+    }
+
+    /// Remove all elements
+    public mutating func removeAll() {
+        storage.removeAll()
+        head = 0
+        count = 0
+    }
+}
+
+extension RingBuffer: RandomAccessCollection {
+    public var startIndex: Int { 0 }
+    public var endIndex: Int { count }
+
+    public subscript(position: Int) -> Element {
+        precondition(position >= 0 && position < count, "Index out of range")
+        return storage[(head + position) % storage.count]
+    }
+}
@@ -78,11 +78,7 @@ public class WorkflowEngine {
         )
         
         // Store execution history (convert UUID to String for storage)
-        let historyKey = workflow.id.uuidString
-        if executionHistory[historyKey] == nil {
-            executionHistory[historyKey] = []
-        }
-        executionHistory[historyKey]?.append(workflowResult)
+        executionHistory[workflow.id.uuidString, default: []].append(workflowResult)
         
         return workflowResult
     }
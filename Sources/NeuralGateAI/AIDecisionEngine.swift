@@ -47,11 +47,23 @@ public class AIDecisionEngine {
         // Calculate aggregate confidence
         let avgConfidence = predictions.reduce(0.0) { $0 + $1.confidence } / Double(predictions.count)
         
+        // Number of models that voted for the final decision
+        let agreementCount = predictions.filter { $0.decision == decision }.count
+        
         // Build explanation
-        let explanation = buildExplanation(predictions: predictions, finalDecision: decision)
+        let explanation = buildExplanation(
+            predictions: predictions,
+            finalDecision: decision,
+            agreementCount: agreementCount
+        )
         
         // Extract contributing factors
-        let factors = extractFactors(task: task, predictions: predictions)
+        let factors = extractFactors(
+            task: task,
+            predictions: predictions,
+            agreementCount: agreementCount,
+            averageConfidence: avgConfidence
+        )
         
         return ExplainableResult(
             value: decision,
@@ -78,14 +90,14 @@ public class AIDecisionEngine {
     /// Build human-readable explanation
     private func buildExplanation(
         predictions: [(model: String, decision: TaskDecision, confidence: Double)],
-        finalDecision: TaskDecision
+        finalDecision: TaskDecision,
+        agreementCount: Int
     ) -> String {
         guard configuration.enableExplainability else {
             return "Decision made by AI ensemble"
         }
         
         let modelCount = predictions.count
-        let agreementCount = predictions.filter { $0.decision == finalDecision }.count
         let agreementPercentage = (Double(agreementCount) / Double(modelCount)) * 100
         
         var explanation = "Decision: \(finalDecision.rawValue)\n"
@@ -100,15 +112,19 @@ public class AIDecisionEngine {
     }
     
     /// Extract contributing factors
+    /// - Note: `agreementCount` and `averageConfidence` are passed in from `makeDecision`
+    ///   so the ensemble vote is not recomputed for every prediction.
     private func extractFactors(
         task: Task,
-        predictions: [(model: String, decision: TaskDecision, confidence: Double)]
+        predictions: [(model: String, decision: TaskDecision, confidence: Double)],
+        agreementCount: Int,
+        averageConfidence: Double
     ) -> [String: Double] {
         var factors: [String: Double] = [:]
         
         factors["priority"] = Double(task.priority.weight) / 4.0
-        factors["model_agreement"] = Double(predictions.filter { $0.decision == ensembleVote(predictions: predictions) }.count) / Double(predictions.count)
-        factors["avg_confidence"] = predictions.reduce(0.0) { $0 + $1.confidence } / Double(predictions.count)
+        factors["model_agreement"] = Double(agreementCount) / Double(predictions.count)
+        factors["avg_confidence"] = averageConfidence
         
         return factors
     }
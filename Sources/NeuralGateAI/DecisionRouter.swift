@@ -29,6 +29,13 @@ public actor DecisionRouter: Routing {
     
     private let logger = NeuralGateLogger.shared
     
+    /// Keywords that indicate complexity
+    private static let complexityKeywords = [
+        "analyze", "compare", "evaluate", "synthesize", "explain",
+        "calculate", "optimize", "predict", "recommend", "summarize",
+        "integrate", "coordinate", "orchestrate", "transform"
+    ]
+    
     public init(complexityThreshold: Double = 0.6) {
         self.complexityThreshold = max(0.0, min(1.0, complexityThreshold))
     }
@@ -80,16 +87,9 @@ public actor DecisionRouter: Routing {
         let tokenCount = Double(tokens.count)
         let lengthScore = min(1.0, tokenCount / 50.0)
         
-        // Keywords that indicate complexity
-        let complexityKeywords = [
-            "analyze", "compare", "evaluate", "synthesize", "explain",
-            "calculate", "optimize", "predict", "recommend", "summarize",
-            "integrate", "coordinate", "orchestrate", "transform"
-        ]
-        
         // Count complexity keywords in the prompt (case-insensitive)
         let lowercasePrompt = normalized.lowercased()
-        let keywordCount = complexityKeywords.reduce(0) { count, keyword in
+        let keywordCount = Self.complexityKeywords.reduce(0) { count, keyword in
             count + (lowercasePrompt.contains(keyword) ? 1 : 0)
         }
         
@@ -110,7 +110,8 @@ public actor DecisionRouter: Routing {
         #if canImport(CryptoKit)
         let data = Data(prompt.utf8)
         let hash = SHA256.hash(data: data)
-        return hash.compactMap { String(format: "%02x", $0) }.joined().prefix(16).description
+        // Only the first 8 bytes (16 hex characters) are kept, so skip formatting the rest
+        return hash.prefix(8).map { String(format: "%02x", $0) }.joined()
         #else
         // Fallback for platforms without CryptoKit
         return String(prompt.hashValue, radix: 16).prefix(16).description
@@ -4,7 +4,7 @@ import NeuralGate
 /// Predictive Analytics Engine for pattern recognition and task suggestions
 public class PredictiveAnalytics {
     private let configuration: NeuralGateConfiguration
-    private var taskHistory: [Task] = []
+    private var taskHistory = RingBuffer<Task>(capacity: 1000) // Keep only recent history
     private var patterns: [TaskPattern] = []
     private let logger = NeuralGateLogger.shared
     
@@ -16,11 +16,6 @@ public class PredictiveAnalytics {
     public func recordTask(_ task: Task) {
         taskHistory.append(task)
         
-        // Keep only recent history (last 1000 tasks)
-        if taskHistory.count > 1000 {
-            taskHistory.removeFirst(taskHistory.count - 1000)
-        }
-        
         // Update patterns periodically
         if taskHistory.count % 10 == 0 {
             updatePatterns()
@@ -29,7 +24,8 @@ public class PredictiveAnalytics {
     
     /// Get predictive suggestions based on current context
     public func getSuggestions(context: ExecutionContext) -> [TaskSuggestion] {
-        guard configuration.enablePredictiveAnalytics else {
+        // Nothing to match until enough history has produced patterns
+        guard configuration.enablePredictiveAnalytics, !patterns.isEmpty else {
             return []
         }
         
@@ -50,8 +46,8 @@ public class PredictiveAnalytics {
             }
         }
         
-        // Sort by confidence
-        return suggestions.sorted { $0.confidence > $1.confidence }
+        // Patterns are kept sorted by confidence, so suggestions already are
+        return suggestions
     }
     
     /// Analyze task patterns and identify frequently repeated sequences
@@ -61,9 +57,10 @@ public class PredictiveAnalytics {
         // Group tasks by category and time window
         var categorySequences: [Task.TaskCategory: [[Task]]] = [:]
         
-        for category in Task.TaskCategory.allCases {
-            let categoryTasks = taskHistory.filter { $0.category == category }
-            
+        // Bucket history in a single pass instead of filtering it once per category
+        let tasksByCategory = Dictionary(grouping: taskHistory) { $0.category }
+        
+        for (category, categoryTasks) in tasksByCategory {
             // Look for sequences within 1 hour windows
             var sequences: [[Task]] = []
             var currentSequence: [Task] = []
@@ -117,6 +114,9 @@ public class PredictiveAnalytics {
             }
         }
         
+        // Sort once here rather than on every suggestion request
+        patterns.sort { $0.confidence > $1.confidence }
+        
         logger.log("Updated patterns: \(patterns.count) patterns identified", level: .info)
     }
 }
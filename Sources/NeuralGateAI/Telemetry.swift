@@ -14,6 +14,7 @@ public enum TelemetryThermalState: Int {
 #endif
 
 /// Telemetry event types
+@available(*, deprecated, message: "Telemetry no longer stores events; this type is unused and ignored")
 public enum TelemetryEvent {
     case routingDecision(mode: String, score: Double, thermalState: String, timestamp: Date)
     case remoteCallResult(success: Bool, latency: TimeInterval, failureReason: String?)
@@ -34,9 +35,21 @@ public class Telemetry {
     #endif
     
     private let logger = NeuralGateLogger.shared
-    private var events: [TelemetryEvent] = []
-    private let maxStoredEvents = 1000
-    private let queue = DispatchQueue(label: "com.neuralgate.telemetry", attributes: .concurrent)
+    private static let maxStoredEvents = 1000
+    // Serial: statistics reads fill the cache, so reads mutate state just like writes
+    private let queue = DispatchQueue(label: "com.neuralgate.telemetry")
+    
+    // Statistics are cached until the next write, since computing them sorts every sample
+    private var cachedRoutingStatistics: RoutingStatistics?
+    private var cachedRemoteCallStatistics: RemoteCallStatistics?
+    
+    // Events are stored column-wise, one ring buffer per field that statistics read,
+    // so computing statistics never pattern-matches over unrelated event kinds.
+    // Columns of the same event kind are appended together and stay index-aligned.
+    private var routingModes = RingBuffer<String>(capacity: Telemetry.maxStoredEvents)
+    private var routingScores = RingBuffer<Double>(capacity: Telemetry.maxStoredEvents)
+    private var remoteCallSuccesses = RingBuffer<Bool>(capacity: Telemetry.maxStoredEvents)
+    private var remoteCallLatencies = RingBuffer<TimeInterval>(capacity: Telemetry.maxStoredEvents)
     
     private init() {}
     
@@ -44,19 +57,19 @@ public class Telemetry {
     public func recordRoutingDecision(
         mode: ExecutionMode,
         score: Double,
-        thermalState: TelemetryThermalState,
-        timestamp: Date = Date()
+        thermalState: TelemetryThermalState
     ) {
         guard isEnabled else { return }
         
-        let event = TelemetryEvent.routingDecision(
-            mode: mode.rawValue,
-            score: score,
-            thermalState: thermalStateString(thermalState),
-            timestamp: timestamp
-        )
-        
-        recordEvent(event)
+        // Only the mode and score feed statistics; thermal state is logged, not stored
+        queue.async { [weak self] in
+            guard let self = self else { return }
+            
+            // Each column evicts its oldest entry once maxStoredEvents is reached
+            self.routingModes.append(mode.rawValue)
+            self.routingScores.append(score)
+            self.cachedRoutingStatistics = nil
+        }
         
         logger.log(
             "Telemetry: Routing decision - mode: \(mode.rawValue), score: \(String(format: "%.3f", score)), thermal: \(thermalStateString(thermalState))",
@@ -64,6 +77,17 @@ public class Telemetry {
         )
     }
     
+    /// Record a routing decision event
+    @available(*, deprecated, message: "timestamp is ignored; use recordRoutingDecision(mode:score:thermalState:)")
+    public func recordRoutingDecision(
+        mode: ExecutionMode,
+        score: Double,
+        thermalState: TelemetryThermalState,
+        timestamp: Date
+    ) {
+        recordRoutingDecision(mode: mode, score: score, thermalState: thermalState)
+    }
+    
     /// Record a remote call result event
     public func recordRemoteCallResult(
         success: Bool,
@@ -72,13 +96,13 @@ public class Telemetry {
     ) {
         guard isEnabled else { return }
         
-        let event = TelemetryEvent.remoteCallResult(
-            success: success,
-            latency: latency,
-            failureReason: failureReason
-        )
-        
-        recordEvent(event)
+        queue.async { [weak self] in
+            guard let self = self else { return }
+            
+            self.remoteCallSuccesses.append(success)
+            self.remoteCallLatencies.append(latency)
+            self.cachedRemoteCallStatistics = nil
+        }
         
         let statusStr = success ? "success" : "failure"
         let reasonStr = failureReason.map { " - reason: \($0)" } ?? ""
@@ -95,62 +119,40 @@ public class Telemetry {
     ) {
         guard isEnabled else { return }
         
-        let event = TelemetryEvent.powerStateChange(
-            thermalState: thermalStateString(thermalState),
-            isLowPowerMode: isLowPowerMode
-        )
-        
-        recordEvent(event)
-        
+        // Power state changes feed no statistics, so they are only logged
         logger.log(
             "Telemetry: Power state change - thermal: \(thermalStateString(thermalState)), lowPower: \(isLowPowerMode)",
             level: .debug
         )
     }
     
-    /// Record an event to storage
-    private func recordEvent(_ event: TelemetryEvent) {
-        queue.async(flags: .barrier) { [weak self] in
-            guard let self = self else { return }
-            
-            self.events.append(event)
-            
-            // Trim events if exceeding max storage
-            if self.events.count > self.maxStoredEvents {
-                self.events.removeFirst(self.events.count - self.maxStoredEvents)
-            }
-        }
-    }
-    
     /// Get statistics for routing decisions
     public func getRoutingStatistics() -> RoutingStatistics? {
         guard isEnabled else { return nil }
         
         return queue.sync {
-            let routingEvents = events.compactMap { event -> (mode: String, score: Double)? in
-                if case .routingDecision(let mode, let score, _, _) = event {
-                    return (mode, score)
-                }
-                return nil
+            if let cached = cachedRoutingStatistics {
+                return cached
             }
             
-            guard !routingEvents.isEmpty else { return nil }
+            guard !routingScores.isEmpty else { return nil }
             
-            let scores = routingEvents.map { $0.score }
-            let medianScore = calculateMedian(scores)
-            let avgScore = scores.reduce(0, +) / Double(scores.count)
+            let medianScore = calculateMedian(routingScores)
+            let avgScore = routingScores.reduce(0, +) / Double(routingScores.count)
             
             var modeCounts: [String: Int] = [:]
-            for event in routingEvents {
-                modeCounts[event.mode, default: 0] += 1
+            for mode in routingModes {
+                modeCounts[mode, default: 0] += 1
             }
             
-            return RoutingStatistics(
-                totalDecisions: routingEvents.count,
+            let statistics = RoutingStatistics(
+                totalDecisions: routingScores.count,
                 medianComplexity: medianScore,
                 averageComplexity: avgScore,
                 modeCounts: modeCounts
             )
+            cachedRoutingStatistics = statistics
+            return statistics
         }
     }
     
@@ -159,35 +161,40 @@ public class Telemetry {
         guard isEnabled else { return nil }
         
         return queue.sync {
-            let callEvents = events.compactMap { event -> (success: Bool, latency: TimeInterval)? in
-                if case .remoteCallResult(let success, let latency, _) = event {
-                    return (success, latency)
-                }
-                return nil
+            if let cached = cachedRemoteCallStatistics {
+                return cached
             }
             
-            guard !callEvents.isEmpty else { return nil }
+            guard !remoteCallLatencies.isEmpty else { return nil }
             
-            let successCount = callEvents.filter { $0.success }.count
-            let successRate = Double(successCount) / Double(callEvents.count)
+            let successCount = remoteCallSuccesses.reduce(0) { $0 + ($1 ? 1 : 0) }
+            let successRate = Double(successCount) / Double(remoteCallSuccesses.count)
             
-            let latencies = callEvents.map { $0.latency }
-            let medianLatency = calculateMedian(latencies)
-            let avgLatency = latencies.reduce(0, +) / Double(latencies.count)
+            let medianLatency = calculateMedian(remoteCallLatencies)
+            let avgLatency = remoteCallLatencies.reduce(0, +) / Double(remoteCallLatencies.count)
             
-            return RemoteCallStatistics(
-                totalCalls: callEvents.count,
+            let statistics = RemoteCallStatistics(
+                totalCalls: remoteCallLatencies.count,
                 successRate: successRate,
                 medianLatency: medianLatency,
                 averageLatency: avgLatency
             )
+            cachedRemoteCallStatistics = statistics
+            return statistics
         }
     }
     
     /// Clear all stored events
     public func clear() {
-        queue.async(flags: .barrier) { [weak self] in
-            self?.events.removeAll()
+        queue.async { [weak self] in
+            guard let self = self else { return }
+            
+            self.routingModes.removeAll()
+            self.routingScores.removeAll()
+            self.remoteCallSuccesses.removeAll()
+            self.remoteCallLatencies.removeAll()
+            self.cachedRoutingStatistics = nil
+            self.cachedRemoteCallStatistics = nil
         }
     }
     
@@ -203,7 +210,7 @@ public class Telemetry {
         }
     }
     
-    private func calculateMedian(_ values: [Double]) -> Double {
+    private func calculateMedian<Values: Collection>(_ values: Values) -> Double where Values.Element == Double {
         guard !values.isEmpty else { return 0.0 }
         
         let sorted = values.sorted()
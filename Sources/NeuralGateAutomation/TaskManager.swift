@@ -6,8 +6,9 @@ import NeuralGateAI
 public class TaskManager {
     private let configuration: NeuralGateConfiguration
     private var taskQueue: [Task] = []
-    private var completedTasks: [Task] = []
-    private var failedTasks: [(task: Task, error: Error)] = []
+    // Only the totals are reported, so finished tasks are counted rather than retained
+    private var completedCount = 0
+    private var failedCount = 0
     private let logger = NeuralGateLogger.shared
     
     // Redundancy settings
@@ -20,8 +21,20 @@ public class TaskManager {
     
     /// Add task to queue
     public func enqueueTask(_ task: Task) {
-        taskQueue.append(task)
-        taskQueue.sort { $0.priority.weight > $1.priority.weight }
+        // The queue is already ordered, so binary-search the insertion point instead of
+        // re-sorting; inserting after equal priorities keeps FIFO order within a priority
+        let weight = task.priority.weight
+        var low = 0
+        var high = taskQueue.count
+        while low < high {
+            let mid = (low + high) / 2
+            if taskQueue[mid].priority.weight >= weight {
+                low = mid + 1
+            } else {
+                high = mid
+            }
+        }
+        taskQueue.insert(task, at: low)
         logger.log("Task enqueued: \(task.name) (priority: \(task.priority.rawValue))", level: .info)
     }
     
@@ -39,7 +52,7 @@ public class TaskManager {
             let result = try await executeTaskWithFailover(task)
             
             if result.status == .completed {
-                completedTasks.append(task)
+                completedCount += 1
                 retryCount.removeValue(forKey: task.id)
             }
             
@@ -62,7 +75,7 @@ public class TaskManager {
                 return try await executeNextTask()
             } else {
                 // Max retries exceeded, mark as failed
-                failedTasks.append((task, error))
+                failedCount += 1
                 retryCount.removeValue(forKey: task.id)
                 
                 return TaskExecutionResult(
@@ -133,16 +146,16 @@ public class TaskManager {
     public func getStatistics() -> TaskStatistics {
         return TaskStatistics(
             totalQueued: taskQueue.count,
-            totalCompleted: completedTasks.count,
-            totalFailed: failedTasks.count,
+            totalCompleted: completedCount,
+            totalFailed: failedCount,
             completionRate: calculateCompletionRate()
         )
     }
     
     private func calculateCompletionRate() -> Double {
-        let total = completedTasks.count + failedTasks.count
+        let total = completedCount + failedCount
         guard total > 0 else { return 0.0 }
-        return Double(completedTasks.count) / Double(total)
+        return Double(completedCount) / Double(total)
     }
 }
 
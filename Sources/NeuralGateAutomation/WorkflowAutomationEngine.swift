@@ -207,7 +207,7 @@ public struct WorkflowResult {
     public let endTime: Date
     
     public var successRate: Double {
-        let completed = executedTasks.filter { $0.status == .completed }.count
+        let completed = executedTasks.reduce(0) { $0 + ($1.status == .completed ? 1 : 0) }
         return Double(completed) / Double(executedTasks.count)
     }
 }
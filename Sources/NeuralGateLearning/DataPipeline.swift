@@ -4,12 +4,12 @@ import NeuralGate
 /// Data Pipeline for Model Updates and Training
 public class DataPipeline {
     private let configuration: NeuralGateConfiguration
-    private var dataCache: [DataPoint] = []
+    private var dataCache = RingBuffer<DataPoint>(capacity: DataPipeline.cacheSize)
     private var lastUpdateTime: Date?
     private let logger = NeuralGateLogger.shared
     
     // Pipeline configuration
-    private let cacheSize = 10000
+    private static let cacheSize = 10000
     private let updateInterval: TimeInterval = 3600 // 1 hour
     
     public init(configuration: NeuralGateConfiguration) {
@@ -18,13 +18,9 @@ public class DataPipeline {
     
     /// Add data point to pipeline
     public func addDataPoint(_ dataPoint: DataPoint) {
+        // Maintain cache size: the ring buffer evicts the oldest point once full
         dataCache.append(dataPoint)
         
-        // Maintain cache size
-        if dataCache.count > cacheSize {
-            dataCache.removeFirst(dataCache.count - cacheSize)
-        }
-        
         logger.log("Data point added to pipeline", level: .debug)
         
         // Check if update is needed
@@ -59,22 +55,24 @@ public class DataPipeline {
         lastUpdateTime = Date()
         
         // Clear old data after update
-        if dataCache.count > cacheSize / 2 {
+        if dataCache.count > Self.cacheSize / 2 {
             dataCache.removeFirst(dataCache.count / 2)
         }
     }
     
     /// Get data enrichment statistics
     public func getStatistics() -> DataPipelineStatistics {
-        let recentData = dataCache.filter { 
-            Date().timeIntervalSince($0.timestamp) < 86400 // Last 24 hours
+        // Read the clock once instead of once per cached data point
+        let now = Date()
+        let recentCount = dataCache.reduce(0) { count, dataPoint in
+            count + (now.timeIntervalSince(dataPoint.timestamp) < 86400 ? 1 : 0) // Last 24 hours
         }
         
         return DataPipelineStatistics(
             totalDataPoints: dataCache.count,
-            recentDataPoints: recentData.count,
+            recentDataPoints: recentCount,
             lastUpdateTime: lastUpdateTime,
-            cacheUtilization: Double(dataCache.count) / Double(cacheSize)
+            cacheUtilization: Double(dataCache.count) / Double(Self.cacheSize)
         )
     }
     
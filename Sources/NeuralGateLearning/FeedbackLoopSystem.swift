@@ -5,8 +5,11 @@ import NeuralGateAI
 /// Feedback Loop System for continuous learning and improvement
 public class FeedbackLoopSystem {
     private let configuration: NeuralGateConfiguration
-    private var feedbackHistory: [TaskFeedback] = []
-    private var adaptationRules: [AdaptationRule] = []
+    /// Running per-category totals, updated as feedback arrives
+    private var categoryStatistics: [Task.TaskCategory: CategoryStatistics] = [:]
+    /// Rules keyed by task category, then adaptation type, so lookups and
+    /// replacements don't scan every learned rule
+    private var adaptationRules: [Task.TaskCategory: [AdaptationRule.AdaptationType: AdaptationRule]] = [:]
     private let logger = NeuralGateLogger.shared
     
     public init(configuration: NeuralGateConfiguration) {
@@ -15,83 +18,94 @@ public class FeedbackLoopSystem {
     
     /// Record feedback for a completed task
     public func recordFeedback(_ feedback: TaskFeedback) {
-        feedbackHistory.append(feedback)
+        categoryStatistics[feedback.taskCategory, default: CategoryStatistics()].record(feedback)
         logger.log("Feedback recorded for task: \(feedback.taskId)", level: .info)
         
-        // Analyze feedback and update adaptation rules
-        analyzeFeedback()
+        // Only this category's totals changed, so only its rules need re-evaluating
+        analyzeFeedback(for: feedback.taskCategory)
     }
     
     /// Get adaptation suggestions based on feedback
     public func getAdaptations(for task: Task) -> [Adaptation] {
-        var adaptations: [Adaptation] = []
+        guard let rules = adaptationRules[task.category] else {
+            return []
+        }
         
-        for rule in adaptationRules {
-            if rule.appliesTo(task: task) {
-                let adaptation = Adaptation(
-                    type: rule.adaptationType,
-                    description: rule.description,
-                    confidence: rule.confidence,
-                    impact: rule.estimatedImpact
-                )
-                adaptations.append(adaptation)
-            }
+        let adaptations = rules.values.map { rule in
+            Adaptation(
+                type: rule.adaptationType,
+                description: rule.description,
+                confidence: rule.confidence,
+                impact: rule.estimatedImpact
+            )
         }
         
-        return adaptations.sorted { $0.confidence > $1.confidence }
+        // Break confidence ties by a fixed type order rather than rule creation order,
+        // since dictionary order varies between runs
+        return adaptations.sorted {
+            if $0.confidence != $1.confidence {
+                return $0.confidence > $1.confidence
+            }
+            return $0.type.sortOrder < $1.type.sortOrder
+        }
     }
     
-    /// Analyze feedback to discover improvement opportunities
-    private func analyzeFeedback() {
+    /// Analyze a category's feedback to discover improvement opportunities
+    private func analyzeFeedback(for category: Task.TaskCategory) {
         logger.log("Analyzing feedback for improvements", level: .debug)
         
-        // Group feedback by task category
-        let categoryGroups = Dictionary(grouping: feedbackHistory) { $0.taskCategory }
+        guard let statistics = categoryStatistics[category] else { return }
+        
+        // Calculate success rate
+        let successRate = Double(statistics.successCount) / Double(statistics.count)
         
-        // Analyze each category
-        for (category, feedbacks) in categoryGroups {
-            // Calculate success rate
-            let positiveCount = feedbacks.filter { $0.wasSuccessful }.count
-            let successRate = Double(positiveCount) / Double(feedbacks.count)
+        // Identify low-performing areas
+        if successRate < 0.7 && statistics.count >= 5 {
+            let rule = AdaptationRule(
+                category: category,
+                adaptationType: .increaseAttention,
+                description: "Increase attention to \(category.rawValue) tasks (current success: \(Int(successRate * 100))%)",
+                confidence: 1.0 - successRate,
+                estimatedImpact: 0.3
+            )
             
-            // Identify low-performing areas
-            if successRate < 0.7 && feedbacks.count >= 5 {
-                let rule = AdaptationRule(
-                    category: category,
-                    adaptationType: .increaseAttention,
-                    description: "Increase attention to \(category.rawValue) tasks (current success: \(Int(successRate * 100))%)",
-                    confidence: 1.0 - successRate,
-                    estimatedImpact: 0.3
-                )
-                
-                // Update or add rule
-                if let index = adaptationRules.firstIndex(where: { $0.category == category && $0.adaptationType == .increaseAttention }) {
-                    adaptationRules[index] = rule
-                } else {
-                    adaptationRules.append(rule)
-                }
-            }
+            // Update or add rule
+            adaptationRules[category, default: [:]][rule.adaptationType] = rule
+        }
+        
+        // Analyze execution time patterns
+        let avgTime = statistics.totalExecutionTime / Double(statistics.count)
+        if avgTime > 60.0 { // More than 1 minute average
+            let rule = AdaptationRule(
+                category: category,
+                adaptationType: .optimizeExecution,
+                description: "Optimize execution for \(category.rawValue) tasks (avg time: \(Int(avgTime))s)",
+                confidence: 0.8,
+                estimatedImpact: 0.2
+            )
             
-            // Analyze execution time patterns
-            let avgTime = feedbacks.compactMap { $0.executionTime }.reduce(0.0, +) / Double(feedbacks.count)
-            if avgTime > 60.0 { // More than 1 minute average
-                let rule = AdaptationRule(
-                    category: category,
-                    adaptationType: .optimizeExecution,
-                    description: "Optimize execution for \(category.rawValue) tasks (avg time: \(Int(avgTime))s)",
-                    confidence: 0.8,
-                    estimatedImpact: 0.2
-                )
-                
-                if let index = adaptationRules.firstIndex(where: { $0.category == category && $0.adaptationType == .optimizeExecution }) {
-                    adaptationRules[index] = rule
-                } else {
-                    adaptationRules.append(rule)
-                }
-            }
+            adaptationRules[category, default: [:]][rule.adaptationType] = rule
         }
         
-        logger.log("Adaptation rules updated: \(adaptationRules.count) rules", level: .info)
+        let ruleCount = adaptationRules.values.reduce(0) { $0 + $1.count }
+        logger.log("Adaptation rules updated: \(ruleCount) rules", level: .info)
+    }
+}
+
+/// Running feedback totals for a single task category
+private struct CategoryStatistics {
+    var count = 0
+    var successCount = 0
+    
+    /// Sum of reported execution times; feedback without a time still counts toward `count`
+    var totalExecutionTime: TimeInterval = 0.0
+    
+    mutating func record(_ feedback: TaskFeedback) {
+        count += 1
+        if feedback.wasSuccessful {
+            successCount += 1
+        }
+        totalExecutionTime += feedback.executionTime ?? 0.0
     }
 }
 
@@ -140,6 +154,16 @@ public struct AdaptationRule {
         case optimizeExecution
         case changeStrategy
         case addVerification
+        
+        /// Stable ordering used to break confidence ties
+        var sortOrder: Int {
+            switch self {
+            case .increaseAttention: return 0
+            case .optimizeExecution: return 1
+            case .changeStrategy: return 2
+            case .addVerification: return 3
+            }
+        }
     }
 }
 
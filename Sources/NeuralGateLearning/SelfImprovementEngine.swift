@@ -19,6 +19,7 @@ public class SelfImprovementEngine {
         logger.log("Evaluating performance for self-improvement", level: .info)
         
         let metrics = performanceMetrics
+        let maxMemoryUsage = Double(configuration.maxMemoryUsage)
         var opportunities: [ImprovementOpportunity] = []
         
         // Analyze accuracy
@@ -44,11 +45,11 @@ public class SelfImprovementEngine {
         }
         
         // Analyze resource usage
-        if metrics.averageMemoryUsage > Double(configuration.maxMemoryUsage) * 0.8 {
+        if metrics.averageMemoryUsage > maxMemoryUsage * 0.8 {
             opportunities.append(ImprovementOpportunity(
                 area: .resourceUsage,
                 currentValue: metrics.averageMemoryUsage,
-                targetValue: Double(configuration.maxMemoryUsage) * 0.6,
+                targetValue: maxMemoryUsage * 0.6,
                 priority: .high,
                 suggestedAction: "Implement memory optimization strategies"
             ))
@@ -124,7 +125,9 @@ public class SelfImprovementEngine {
         performanceMetrics.totalMemoryUsed += taskResult.memoryUsed
         
         if let rating = taskResult.userRating {
-            performanceMetrics.userRatings.append(rating)
+            performanceMetrics.userRatingCount += 1
+            performanceMetrics.totalUserRating += rating
+            performanceMetrics.ratingHistory.append(rating)
         }
         
         // Recalculate derived metrics
@@ -132,8 +135,8 @@ public class SelfImprovementEngine {
         performanceMetrics.averageExecutionTime = performanceMetrics.totalExecutionTime / Double(performanceMetrics.totalTasks)
         performanceMetrics.averageMemoryUsage = Double(performanceMetrics.totalMemoryUsed) / Double(performanceMetrics.totalTasks)
         
-        if !performanceMetrics.userRatings.isEmpty {
-            performanceMetrics.userSatisfactionScore = performanceMetrics.userRatings.reduce(0.0, +) / Double(performanceMetrics.userRatings.count)
+        if performanceMetrics.userRatingCount > 0 {
+            performanceMetrics.userSatisfactionScore = performanceMetrics.totalUserRating / Double(performanceMetrics.userRatingCount)
         }
     }
     
@@ -172,7 +175,22 @@ public struct PerformanceMetrics {
     public var averageMemoryUsage: Double = 0.0
     public var totalMemoryUsed: Int = 0
     public var userSatisfactionScore: Double = 0.0
-    public var userRatings: [Double] = []
+    public var totalUserRating: Double = 0.0
+    public var userRatingCount: Int = 0
+    
+    // Backs the deprecated `userRatings` until it is removed
+    var ratingHistory: [Double] = []
+    
+    /// Every rating received, in order
+    @available(*, deprecated, message: "use totalUserRating / userRatingCount")
+    public var userRatings: [Double] {
+        get { ratingHistory }
+        set {
+            ratingHistory = newValue
+            totalUserRating = newValue.reduce(0, +)
+            userRatingCount = newValue.count
+        }
+    }
 }
 
 /// Result of a task execution
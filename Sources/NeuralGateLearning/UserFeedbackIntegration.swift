@@ -7,6 +7,8 @@ public class UserFeedbackIntegration {
     private var feedbackQueue: [UserFeedback] = []
     private let logger = NeuralGateLogger.shared
     
+    private static let maxReportedImprovements = 5
+    
     public init(configuration: NeuralGateConfiguration) {
         self.configuration = configuration
     }
@@ -41,6 +43,19 @@ public class UserFeedbackIntegration {
     
     /// Analyze feedback to extract insights
     private func analyzeFeedback(_ feedbacks: [UserFeedback]) -> FeedbackAnalysis {
+        // getStatus() processes the queue on every call, which is usually empty
+        guard !feedbacks.isEmpty else {
+            return FeedbackAnalysis(
+                totalFeedback: 0,
+                positiveCount: 0,
+                negativeCount: 0,
+                bugReports: 0,
+                featureRequests: 0,
+                satisfactionScore: 0.0,
+                topImprovements: []
+            )
+        }
+        
         var positiveCount = 0
         var negativeCount = 0
         var bugReports = 0
@@ -58,12 +73,14 @@ public class UserFeedbackIntegration {
             case .featureRequest:
                 featureRequests += 1
             case .improvement:
-                improvements.append(feedback.message)
+                // Only the first few are reported, so stop collecting once we have them
+                if improvements.count < Self.maxReportedImprovements {
+                    improvements.append(feedback.message)
+                }
             }
         }
         
-        let satisfactionScore = feedbacks.isEmpty ? 0.0 : 
-            Double(positiveCount) / Double(feedbacks.count)
+        let satisfactionScore = Double(positiveCount) / Double(feedbacks.count)
         
         return FeedbackAnalysis(
             totalFeedback: feedbacks.count,
@@ -72,7 +89,7 @@ public class UserFeedbackIntegration {
             bugReports: bugReports,
             featureRequests: featureRequests,
             satisfactionScore: satisfactionScore,
-            topImprovements: improvements.prefix(5).map { $0 }
+            topImprovements: improvements
         )
     }
     
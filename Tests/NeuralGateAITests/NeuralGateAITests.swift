@@ -27,6 +27,29 @@ final class NeuralGateAITests: XCTestCase {
         XCTAssertFalse(result.explanation.isEmpty)
     }
     
+    func testEnsembleKeepsModelOrderAndSkipsFailures() async throws {
+        let engine = AIDecisionEngine(
+            configuration: configuration,
+            models: [
+                StubAIModel(name: "First", decision: .execute, confidence: 0.9),
+                FailingAIModel(),
+                StubAIModel(name: "Second", decision: .deferTask, confidence: 0.4)
+            ]
+        )
+        let task = Task(name: "Ensemble Task", description: "Test", priority: .medium)
+        
+        let result = try await engine.makeDecision(for: task, context: ExecutionContext(currentTask: task))
+        
+        XCTAssertEqual(result.value, .execute)
+        XCTAssertEqual(result.confidence, 0.65, accuracy: 0.001)
+        XCTAssertTrue(result.explanation.contains("Based on 2 model(s)"))
+        XCTAssertFalse(result.explanation.contains("Failing"))
+        
+        let firstRange = try XCTUnwrap(result.explanation.range(of: "First:"))
+        let secondRange = try XCTUnwrap(result.explanation.range(of: "Second:"))
+        XCTAssertLessThan(firstRange.lowerBound, secondRange.lowerBound)
+    }
+    
     func testBaselineModel() async throws {
         let model = BaselineAIModel()
         let task = Task(
@@ -66,3 +89,35 @@ final class NeuralGateAITests: XCTestCase {
         XCTAssertTrue(model.canExecute(configuration: configuration))
     }
 }
+
+// MARK: - Test Models
+
+private struct StubAIModel: AIModel {
+    let name: String
+    let decision: TaskDecision
+    let confidence: Double
+    
+    var estimatedMemoryUsage: Int { 1 }
+    var estimatedCPUUsage: Double { 0.0 }
+    var estimatedBatteryImpact: Double { 0.0 }
+    
+    func canExecute(configuration: NeuralGateConfiguration) -> Bool { true }
+    
+    func predict(task: Task, context: ExecutionContext) async throws -> ModelPrediction {
+        ModelPrediction(decision: decision, confidence: confidence, reasoning: "Stubbed")
+    }
+}
+
+private struct FailingAIModel: AIModel {
+    let name = "Failing"
+    
+    var estimatedMemoryUsage: Int { 1 }
+    var estimatedCPUUsage: Double { 0.0 }
+    var estimatedBatteryImpact: Double { 0.0 }
+    
+    func canExecute(configuration: NeuralGateConfiguration) -> Bool { true }
+    
+    func predict(task: Task, context: ExecutionContext) async throws -> ModelPrediction {
+        throw NeuralGateError.taskExecutionFailed("Stubbed failure")
+    }
+}
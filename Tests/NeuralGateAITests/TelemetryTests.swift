@@ -30,8 +30,7 @@ final class TelemetryTests: XCTestCase {
         telemetry.recordRoutingDecision(
             mode: .local,
             score: 0.45,
-            thermalState: .nominal,
-            timestamp: Date()
+            thermalState: .nominal
         )
         
         let stats = telemetry.getRoutingStatistics()
@@ -195,6 +194,21 @@ final class TelemetryTests: XCTestCase {
         }
     }
     
+    func testStatisticsRefreshAfterNewEvents() {
+        telemetry.recordRoutingDecision(mode: .local, score: 0.2, thermalState: .nominal)
+        let first = telemetry.getRoutingStatistics()
+        
+        telemetry.recordRoutingDecision(mode: .remote, score: 0.8, thermalState: .nominal)
+        let second = telemetry.getRoutingStatistics()
+        
+        if telemetry.isEnabled {
+            XCTAssertEqual(first?.totalDecisions, 1)
+            XCTAssertEqual(second?.totalDecisions, 2)
+            XCTAssertEqual(second?.modeCounts["remote"], 1)
+            XCTAssertEqual(second?.averageComplexity ?? 0, 0.5, accuracy: 0.01)
+        }
+    }
+    
     // MARK: - Median Calculation Tests
     
     func testMedianCalculationOddCount() {
@@ -70,6 +70,25 @@ final class NeuralGateAutomationTests: XCTestCase {
         XCTAssertNotNil(result)
     }
     
+    func testTaskQueuePriorityOrder() async throws {
+        let low = Task(name: "Low", description: "Low", priority: .low)
+        let firstHigh = Task(name: "High 1", description: "High", priority: .high)
+        let medium = Task(name: "Medium", description: "Medium", priority: .medium)
+        let secondHigh = Task(name: "High 2", description: "High", priority: .high)
+        
+        for task in [low, firstHigh, medium, secondHigh] {
+            taskManager.enqueueTask(task)
+        }
+        
+        // Highest priority first, FIFO within the same priority
+        var executedNames: [String] = []
+        while let result = try await taskManager.executeNextTask() {
+            executedNames.append(result.task.name)
+        }
+        
+        XCTAssertEqual(executedNames, ["High 1", "High 2", "Medium", "Low"])
+    }
+    
     func testTaskFailover() async throws {
         let task = Task(name: "Failover Test", description: "Test failover", priority: .critical)
         
@@ -31,6 +31,49 @@ final class NeuralGateLearningTests: XCTestCase {
         XCTAssertTrue(adaptations.isEmpty || adaptations.allSatisfy { $0.confidence > 0.0 })
     }
     
+    func testAdaptationsFromAccumulatedFeedback() {
+        for _ in 0..<5 {
+            let feedback = TaskFeedback(
+                taskId: UUID(),
+                taskCategory: .automation,
+                wasSuccessful: false,
+                executionTime: 90.0
+            )
+            feedbackSystem.recordFeedback(feedback)
+        }
+        
+        let task = Task(name: "Test", description: "Test", category: .automation)
+        let adaptations = feedbackSystem.getAdaptations(for: task)
+        
+        // No successes over 5 tasks and a 90s average should trigger both rules
+        XCTAssertEqual(adaptations.count, 2)
+        XCTAssertEqual(adaptations.first?.type, .increaseAttention)
+        XCTAssertEqual(adaptations.first?.confidence ?? 0, 1.0, accuracy: 0.001)
+        XCTAssertEqual(adaptations.last?.type, .optimizeExecution)
+        
+        let otherTask = Task(name: "Other", description: "Other", category: .productivity)
+        XCTAssertTrue(feedbackSystem.getAdaptations(for: otherTask).isEmpty)
+    }
+    
+    func testAdaptationTiesUseFixedTypeOrder() {
+        // 1 success in 5 gives increaseAttention a confidence of 0.8, tying optimizeExecution
+        for index in 0..<5 {
+            let feedback = TaskFeedback(
+                taskId: UUID(),
+                taskCategory: .communication,
+                wasSuccessful: index == 0,
+                executionTime: 90.0
+            )
+            feedbackSystem.recordFeedback(feedback)
+        }
+        
+        let task = Task(name: "Test", description: "Test", category: .communication)
+        let adaptations = feedbackSystem.getAdaptations(for: task)
+        
+        XCTAssertEqual(adaptations.map { $0.confidence }, [0.8, 0.8])
+        XCTAssertEqual(adaptations.map { $0.type }, [.increaseAttention, .optimizeExecution])
+    }
+    
     func testSelfImprovement() async {
         let evaluation = improvementEngine.evaluatePerformance()
         
@@ -53,6 +96,30 @@ final class NeuralGateLearningTests: XCTestCase {
         XCTAssertGreaterThan(evaluation.metrics.totalTasks, 0)
     }
     
+    func testUserSatisfactionAveragesRatings() {
+        for rating in [4.0, 5.0] {
+            improvementEngine.updateMetrics(taskResult: TaskResult(
+                taskId: UUID(),
+                wasSuccessful: true,
+                executionTime: 1.0,
+                memoryUsed: 10,
+                userRating: rating
+            ))
+        }
+        improvementEngine.updateMetrics(taskResult: TaskResult(
+            taskId: UUID(),
+            wasSuccessful: true,
+            executionTime: 1.0,
+            memoryUsed: 10
+        ))
+        
+        let metrics = improvementEngine.evaluatePerformance().metrics
+        
+        XCTAssertEqual(metrics.userRatingCount, 2)
+        XCTAssertEqual(metrics.totalUserRating, 9.0, accuracy: 0.001)
+        XCTAssertEqual(metrics.userSatisfactionScore, 4.5, accuracy: 0.001)
+    }
+    
     func testImprovementExecution() async {
         let opportunity = ImprovementOpportunity(
             area: .accuracy,
@@ -419,4 +419,56 @@ final class NeuralGateTests: XCTestCase {
         
         XCTAssertEqual(intent.confidence, 0.75)
     }
+    
+    // MARK: - Ring Buffer Tests
+    
+    func testRingBufferEvictsOldestWhenFull() {
+        var buffer = RingBuffer<Int>(capacity: 3)
+        for value in 1...5 {
+            buffer.append(value)
+        }
+        
+        XCTAssertEqual(buffer.count, 3)
+        XCTAssertEqual(Array(buffer), [3, 4, 5])
+    }
+    
+    func testRingBufferRemoveFirstThenAppend() {
+        var buffer = RingBuffer<Int>(capacity: 4)
+        for value in 1...6 {
+            buffer.append(value)
+        }
+        
+        buffer.removeFirst(2)
+        XCTAssertEqual(Array(buffer), [5, 6])
+        
+        buffer.append(7)
+        buffer.append(8)
+        buffer.append(9)
+        XCTAssertEqual(Array(buffer), [6, 7, 8, 9])
+    }
+    
+    func testRingBufferRemoveFirstEverything() {
+        var buffer = RingBuffer<Double>(capacity: 3)
+        for value in [1.0, 2.0, 3.0, 4.0] {
+            buffer.append(value)
+        }
+        
+        buffer.removeFirst(3)
+        XCTAssertTrue(buffer.isEmpty)
+        
+        buffer.append(5.0)
+        XCTAssertEqual(Array(buffer), [5.0])
+    }
+    
+    func testRingBufferRemoveAll() {
+        var buffer = RingBuffer<String>(capacity: 2)
+        buffer.append("a")
+        buffer.append("b")
+        buffer.removeAll()
+        
+        XCTAssertTrue(buffer.isEmpty)
+        
+        buffer.append("c")
+        XCTAssertEqual(Array(buffer), ["c"])
+    }
 }